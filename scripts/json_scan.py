@@ -0,0 +1,85 @@
+"""
+Structural JSON scanning helpers shared by the limit-cycle plotting scripts.
+
+Branch files hold thousands of large `state` arrays; these helpers walk a JSON
+document as text so callers can decode only the members they need and step
+over the rest without building Python objects for them.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Callable, Optional
+
+JSON_DECODER = json.JSONDecoder()
+_JSON_WS = re.compile(r"\s*")
+_JSON_STRUCTURE = re.compile(r'[\[\]{}"]')
+_JSON_STRING_TAIL = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"')
+
+
+def skip_ws(text: str, pos: int) -> int:
+    """Return the index of the first non-whitespace character at or after pos."""
+    return _JSON_WS.match(text, pos).end()
+
+
+def skip_value(text: str, pos: int) -> int:
+    """Return the index just past the JSON value at text[pos] without building it."""
+    if text[pos] not in "[{":
+        return JSON_DECODER.raw_decode(text, pos)[1]
+    depth = 0
+    while True:
+        match = _JSON_STRUCTURE.search(text, pos)
+        if match is None:
+            raise ValueError("Unterminated JSON value.")
+        token = match.group()
+        pos = match.end()
+        if token == '"':
+            tail = _JSON_STRING_TAIL.match(text, pos)
+            if tail is None:
+                raise ValueError("Unterminated JSON string.")
+            pos = tail.end()
+        elif token == "[":
+            close = text.find("]", pos)
+            if (
+                close >= 0
+                and text.find("[", pos, close) < 0
+                and text.find("{", pos, close) < 0
+                and text.find('"', pos, close) < 0
+            ):
+                # Flat array of numbers (e.g. a point state): jump straight past it.
+                pos = close + 1
+                if depth == 0:
+                    return pos
+            else:
+                depth += 1
+        elif token == "{":
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return pos
+
+
+def scan_object(
+    text: str, pos: int, visit: Callable[[str, int], Optional[int]]
+) -> int:
+    """
+    Walk the JSON object at text[pos] and return the index just past it.
+
+    visit(key, value_pos) may consume a member's value and return the index just past
+    it; returning None skips the value without decoding it.
+    """
+    if text[pos] != "{":
+        raise ValueError("Expected a JSON object.")
+    pos = skip_ws(text, pos + 1)
+    if text[pos] == "}":
+        return pos + 1
+    while True:
+        key, pos = JSON_DECODER.raw_decode(text, pos)
+        pos = skip_ws(text, skip_ws(text, pos) + 1)  # past ':'
+        end = visit(key, pos)
+        pos = skip_ws(text, skip_value(text, pos) if end is None else end)
+        if text[pos] == "}":
+            return pos + 1
+        pos = skip_ws(text, pos + 1)  # past ','
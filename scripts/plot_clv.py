@@ -10,16 +10,36 @@ Usage:
 from __future__ import annotations
 
 import argparse
+from itertools import chain
 import json
 import math
+import os
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import matplotlib.pyplot as plt
 from matplotlib.lines import Line2D
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
 import numpy as np
 
+try:  # optional: orjson parses large float arrays several times faster
+    import orjson
+except ImportError:
+    orjson = None
+
 DEFAULT_MAX_ARROWS = 150  # safety so we don't flood the plot
+QUIVER_MAX_ARROWS = 1000  # beyond this, arrows are drawn as headless segments
+_TAB10 = plt.cm.tab10(np.arange(10))  # RGBA rows, one per CLV color
+
+
+def parse_json(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def read_json(path: Path) -> Any:
+    return parse_json(path.read_bytes())
 
 
 def discover_clv_sets(systems_root: Path) -> List[Dict[str, Any]]:
@@ -27,16 +47,44 @@ def discover_clv_sets(systems_root: Path) -> List[Dict[str, Any]]:
     if not systems_root.exists():
         return records
 
-    for system_dir in systems_root.iterdir():
-        if not system_dir.is_dir():
-            continue
+    # os.scandir hands back cached file types, avoiding a stat per entry.
+    with os.scandir(systems_root) as system_entries:
+        system_dirs = [Path(e.path) for e in system_entries if e.is_dir()]
+    for system_dir in system_dirs:
         sys_name = system_dir.name
         objects_dir = system_dir / "objects"
-        if not objects_dir.exists():
+        if not objects_dir.is_dir():
             continue
 
-        for obj_file in objects_dir.glob("*.json"):
-            data = json.loads(obj_file.read_text())
+        with os.scandir(objects_dir) as object_entries:
+            obj_files = [
+                Path(e.path)
+                for e in object_entries
+                if e.name.endswith(".json") and e.is_file()
+            ]
+        for obj_file in obj_files:
+            cache = fresh_clv_cache(obj_file)
+            if cache is not None:
+                # Metadata straight from the binary sidecar; no JSON parse.
+                with np.load(cache) as cached:
+                    times = cached["cov_times"]
+                    vectors_shape = cached["cov_vectors"].shape
+                records.append(
+                    {
+                        "system": sys_name,
+                        "object": obj_file.stem,
+                        "path": obj_file,
+                        "cov_times": times,
+                        "cov_dim": vectors_shape[1],
+                        "cov_count": vectors_shape[0],
+                    }
+                )
+                continue
+            raw = obj_file.read_bytes()
+            # Objects without CLVs are rejected by a byte scan, before parsing.
+            if b'"covariantVectors"' not in raw:
+                continue
+            data = parse_json(raw)
             if data.get("type") != "orbit":
                 continue
             cov = data.get("covariantVectors")
@@ -130,19 +178,92 @@ def load_system_varnames(system_dir: Path) -> List[str]:
     sys_json = system_dir / "system.json"
     if not sys_json.exists():
         return []
-    data = json.loads(sys_json.read_text())
+    data = read_json(sys_json)
     return data.get("varNames", [])
 
 
-def interpolate_state(times: np.ndarray, states: np.ndarray, t: float) -> np.ndarray:
-    if t <= times[0]:
-        return states[0]
-    if t >= times[-1]:
-        return states[-1]
-    idx = np.searchsorted(times, t)
-    t0, t1 = times[idx - 1], times[idx]
-    w = 0.0 if t1 == t0 else (t - t0) / (t1 - t0)
-    return (1.0 - w) * states[idx - 1] + w * states[idx]
+def nested_to_array(
+    nested: List[Any], depth: int, dtype: Any = float
+) -> np.ndarray:
+    # np.array walks every nested list object; flattening with chain and a sized
+    # fromiter converts the floats in one pass.
+    shape: List[int] = []
+    probe: Any = nested
+    for _ in range(depth):
+        shape.append(len(probe))
+        probe = probe[0] if len(probe) else []
+    flat: Any = nested
+    for _ in range(depth - 1):
+        flat = chain.from_iterable(flat)
+    return np.fromiter(flat, dtype=dtype, count=math.prod(shape)).reshape(shape)
+
+
+def fresh_clv_cache(obj_file: Path) -> Optional[Path]:
+    # Parsed arrays are cached in a sibling .npz so reruns skip the JSON parse;
+    # the cache is ignored (and rebuilt) whenever the orbit file is newer.
+    cache = obj_file.with_suffix(".npz")
+    try:
+        if cache.stat().st_mtime_ns > obj_file.stat().st_mtime_ns:
+            return cache
+    except FileNotFoundError:
+        pass
+    return None
+
+
+def load_clv_arrays(
+    obj_file: Path, dim: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    cache = fresh_clv_cache(obj_file)
+    if cache is not None:
+        with np.load(cache) as cached:
+            return (
+                cached["cov_times"],
+                cached["cov_vectors"],
+                cached["orbit_times"],
+                cached["orbit_states"],
+            )
+
+    obj_data = read_json(obj_file)
+    cov = obj_data["covariantVectors"]
+    cov_times = np.array(cov["times"], dtype=float)
+    # (checkpoints, dim, dim); only arrow directions are drawn, so float32 suffices.
+    cov_vectors = nested_to_array(cov["vectors"], 3, np.float32)
+    orbit = nested_to_array(obj_data["data"], 2)  # (N, dim+1)
+    orbit_times = orbit[:, 0]
+    orbit_states = orbit[:, 1 : dim + 1]  # drop any extra params beyond dim if present
+
+    cache = obj_file.with_suffix(".npz")
+    tmp = cache.with_name(cache.name + ".tmp")
+    try:
+        with tmp.open("wb") as fh:
+            np.savez(
+                fh,
+                cov_times=cov_times,
+                cov_vectors=cov_vectors,
+                orbit_times=orbit_times,
+                orbit_states=orbit_states,
+            )
+        tmp.replace(cache)
+    except OSError as exc:
+        print(f"Warning: could not write cache {cache}: {exc}")
+    return cov_times, cov_vectors, orbit_times, orbit_states
+
+
+def interpolate_states_batch(
+    times: np.ndarray, states: np.ndarray, query_times: np.ndarray
+) -> np.ndarray:
+    if len(times) == 1:
+        return np.repeat(states[:1], len(query_times), axis=0)
+    # One bracketing search shared by every component; searchsorted reuses the
+    # previous hit as a lower bound when query_times is sorted.
+    hi = np.clip(np.searchsorted(times, query_times, side="right"), 1, len(times) - 1)
+    lo = hi - 1
+    span = times[hi] - times[lo]
+    w = np.divide(
+        query_times - times[lo], span, out=np.zeros_like(span), where=span != 0
+    )
+    w = np.clip(w, 0.0, 1.0)[:, None]  # clamp to the orbit ends
+    return (1.0 - w) * states[lo] + w * states[hi]
 
 
 def main() -> None:
@@ -167,18 +288,12 @@ def main() -> None:
         return
 
     rec = prompt_choice(records)
-    obj_data = json.loads(rec["path"].read_text())
-    cov = obj_data["covariantVectors"]
-    cov_times = np.array(cov["times"], dtype=float)
-    cov_vectors = np.array(cov["vectors"], dtype=float)  # shape: (checkpoints, dim, dim)
-    dim = cov["dim"]
+    dim = rec["cov_dim"]
 
     if dim < 3:
         raise RuntimeError("Need at least 3 state dimensions for a 3D plot.")
 
-    orbit = np.array(obj_data["data"], dtype=float)  # (N, dim+1)
-    orbit_times = orbit[:, 0]
-    orbit_states = orbit[:, 1 : dim + 1]  # drop any extra params beyond dim if present
+    cov_times, cov_vectors, orbit_times, orbit_states = load_clv_arrays(rec["path"], dim)
 
     t_start = ask_float("Start time", cov_times[0])
     t_end = ask_float("End time", cov_times[-1])
@@ -191,9 +306,10 @@ def main() -> None:
         print("No vector indices chosen; nothing to plot.")
         return
 
-    # Filter checkpoints by time window
-    mask = (cov_times >= t_start) & (cov_times <= t_end)
-    indices = np.flatnonzero(mask)[::stride]
+    # Filter checkpoints by time window (checkpoint times are increasing)
+    cov_lo = np.searchsorted(cov_times, t_start, side="left")
+    cov_hi = np.searchsorted(cov_times, t_end, side="right")
+    indices = np.arange(cov_lo, cov_hi, stride)
     if not len(indices):
         raise RuntimeError("No CLV checkpoints in the requested window.")
 
@@ -209,10 +325,18 @@ def main() -> None:
         var_names[:3] if len(var_names) >= 3 else [f"x{i+1}" for i in range(3)]
     )
 
+    # Restrict the orbit to the time window (keeping one bracketing sample on each
+    # side for interpolation). orbit_times is sorted, so these are plain slices.
+    lo = max(int(np.searchsorted(orbit_times, t_start, side="right")) - 1, 0)
+    hi = int(np.searchsorted(orbit_times, t_end, side="left")) + 1
+    orbit_times = orbit_times[lo:hi]
+    orbit_states = orbit_states[lo:hi]
+
     # Prepare orbit segment for plotting
-    orbit_mask = (orbit_times >= t_start) & (orbit_times <= t_end)
-    orbit_segment = orbit_states[orbit_mask]
-    orbit_segment_times = orbit_times[orbit_mask]
+    seg_lo = np.searchsorted(orbit_times, t_start, side="left")
+    seg_hi = np.searchsorted(orbit_times, t_end, side="right")
+    orbit_segment = orbit_states[seg_lo:seg_hi]
+    orbit_segment_times = orbit_times[seg_lo:seg_hi]
 
     fig = plt.figure(figsize=(10, 8))
     ax = fig.add_subplot(111, projection="3d")
@@ -226,34 +350,53 @@ def main() -> None:
     )
 
     # Determine a reasonable vector scale (fraction of bounding-box diagonal)
-    bbox = orbit_segment.max(axis=0) - orbit_segment.min(axis=0)
+    bbox = np.ptp(orbit_segment, axis=0)
     diag = np.linalg.norm(bbox)
     vec_scale = 0.15 * (diag if diag > 0 else 1.0)
 
-    colors = plt.cm.tab10(np.linspace(0, 1, len(vector_indices)))
+    colors = _TAB10[np.arange(len(vector_indices)) % len(_TAB10)]
     legend_handles = [
-        Line2D([0], [0], color="gray", linewidth=1.2, label="Orbit segment")
+        Line2D([0], [0], color="gray", linewidth=1.2, label="Orbit segment"),
+        *(
+            Line2D([0], [0], color=color, linewidth=2.0, label=f"CLV {idx}")
+            for color, idx in zip(colors, vector_indices)
+        ),
     ]
-    legend_handles.extend(
-        Line2D([0], [0], color=color, linewidth=2.0, label=f"CLV {idx}")
-        for color, idx in zip(colors, vector_indices)
-    )
 
-    for idx in indices:
-        base_state = interpolate_state(orbit_times, orbit_states, cov_times[idx])
-        for color, v_idx in zip(colors, vector_indices):
-            vec = cov_vectors[idx, v_idx, :3]
-            vec_norm = np.linalg.norm(vec)
-            if vec_norm == 0:
+    # Gather every arrow up front so each CLV index becomes a single draw call.
+    base_states = interpolate_states_batch(orbit_times, orbit_states, cov_times[indices])
+    vecs = cov_vectors[indices][:, vector_indices, :3]  # (checkpoints, vectors, 3)
+    norms = np.linalg.norm(vecs, axis=-1, keepdims=True)
+    directions = np.divide(vecs, norms, out=np.zeros_like(vecs), where=norms > 0)
+    nonzero = norms[..., 0] > 0
+
+    if np.count_nonzero(nonzero) > QUIVER_MAX_ARROWS:
+        # Past this many arrows quiver's per-arrow heads dominate; draw headless
+        # shafts as one Line3DCollection instead.
+        checkpoint_idx, vector_idx = np.nonzero(nonzero)
+        starts = base_states[checkpoint_idx]
+        ends = starts + vec_scale * directions[checkpoint_idx, vector_idx]
+        ax.add_collection3d(
+            Line3DCollection(
+                np.stack([starts, ends], axis=1),
+                colors=colors[vector_idx],
+                linewidths=1.0,
+            )
+        )
+    else:
+        for v, color in enumerate(colors):
+            keep = nonzero[:, v]
+            if not np.any(keep):
                 continue
-            direction = vec / vec_norm
+            origins = base_states[keep]
+            arrows = directions[keep, v]
             ax.quiver(
-                base_state[0],
-                base_state[1],
-                base_state[2],
-                direction[0],
-                direction[1],
-                direction[2],
+                origins[:, 0],
+                origins[:, 1],
+                origins[:, 2],
+                arrows[:, 0],
+                arrows[:, 1],
+                arrows[:, 2],
                 length=vec_scale,
                 color=color,
                 arrow_length_ratio=0.15,
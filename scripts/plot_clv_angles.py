@@ -15,30 +15,62 @@ The plot is a standard Matplotlib figure, so you can drag/pan/zoom with the tool
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 import json
 import math
+import os
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 import matplotlib.pyplot as plt
 import numpy as np
 
+try:  # optional: orjson parses large float arrays several times faster
+    import orjson
+except ImportError:
+    orjson = None
+
+PARALLEL_MIN_CHECKPOINTS = 256  # below this, thread start-up outweighs the work
+ANGLE_CACHE_VERSION = 2  # bump whenever cached angles would change
+
+
+def parse_json(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def read_json(path: Path) -> Any:
+    return parse_json(path.read_bytes())
+
 
 def discover_clv_sets(systems_root: Path) -> List[Dict[str, Any]]:
     records: List[Dict[str, Any]] = []
     if not systems_root.exists():
         return records
 
-    for system_dir in systems_root.iterdir():
-        if not system_dir.is_dir():
-            continue
+    # os.scandir hands back cached file types, avoiding a stat per entry.
+    with os.scandir(systems_root) as system_entries:
+        system_dirs = [Path(e.path) for e in system_entries if e.is_dir()]
+    for system_dir in system_dirs:
         sys_name = system_dir.name
         objects_dir = system_dir / "objects"
-        if not objects_dir.exists():
+        if not objects_dir.is_dir():
             continue
 
-        for obj_file in objects_dir.glob("*.json"):
-            data = json.loads(obj_file.read_text())
+        with os.scandir(objects_dir) as object_entries:
+            obj_files = [
+                Path(e.path)
+                for e in object_entries
+                if e.name.endswith(".json") and e.is_file()
+            ]
+        for obj_file in obj_files:
+            raw = obj_file.read_bytes()
+            # Objects without CLVs are rejected by a byte scan, before parsing.
+            if b'"covariantVectors"' not in raw:
+                continue
+            data = parse_json(raw)
             if data.get("type") != "orbit":
                 continue
             cov = data.get("covariantVectors")
@@ -98,16 +130,41 @@ def ask_int(prompt: str, default: int, min_value: int, max_value: int) -> int:
 
 
 def orthonormal_basis(matrix: np.ndarray) -> np.ndarray:
-    """Return an orthonormal basis spanning the columns of matrix."""
+    """Return an orthonormal basis spanning the columns of matrix.
+
+    Uses modified Gram-Schmidt, dropping nearly-dependent columns as they are
+    met. Pruning a reduced QR afterwards (q[:, keep]) is not equivalent: LAPACK
+    still fills the dropped column with a rounding-noise direction and every
+    later column is orthogonalized against it, so the kept columns can span the
+    wrong subspace.
+    """
     if matrix.shape[1] == 0:
         raise ValueError("Matrix must have at least one column.")
-    q, r = np.linalg.qr(matrix, mode="reduced")
-    # Handle potential rank deficiency by removing nearly-zero vectors.
-    tol = np.max(matrix.shape) * np.finfo(matrix.dtype).eps * np.abs(r).max()
-    keep = np.abs(np.diag(r)) > tol
-    if not np.any(keep):
-        raise ValueError("Subspace appears degenerate; QR produced zero columns.")
-    return q[:, keep]
+    tol = np.max(matrix.shape) * np.finfo(matrix.dtype).eps * np.linalg.norm(matrix, axis=0).max()
+    columns: List[np.ndarray] = []
+    for j in range(matrix.shape[1]):
+        v = matrix[:, j].copy()
+        # Two passes restore orthogonality lost to cancellation on near-dependent columns.
+        for _ in range(2):
+            for q in columns:
+                v -= (q @ v) * q
+        norm = np.linalg.norm(v)
+        if norm > tol:
+            columns.append(v / norm)
+    if not columns:
+        raise ValueError("Subspace appears degenerate; all columns are nearly zero.")
+    return np.column_stack(columns)
+
+
+def max_singular_values(gram: np.ndarray) -> np.ndarray:
+    """Largest singular value of each trailing 2-D matrix in gram."""
+    # A single row or column has exactly one singular value: its Euclidean norm.
+    if gram.shape[-1] == 1:
+        return np.linalg.norm(gram[..., 0], axis=-1)
+    if gram.shape[-2] == 1:
+        return np.linalg.norm(gram[..., 0, :], axis=-1)
+    # Singular values come back non-negative and sorted in descending order.
+    return np.linalg.svd(gram, compute_uv=False)[..., 0]
 
 
 def principal_angle_degrees(cu: np.ndarray, ss: np.ndarray) -> float:
@@ -115,33 +172,125 @@ def principal_angle_degrees(cu: np.ndarray, ss: np.ndarray) -> float:
     cu_basis = orthonormal_basis(cu)
     ss_basis = orthonormal_basis(ss)
     gram = cu_basis.T @ ss_basis
-    singular_values = np.linalg.svd(gram, compute_uv=False)
-    if singular_values.size == 0:
+    if gram.size == 0:
         return 90.0
-    cos_theta = np.clip(np.max(np.abs(singular_values)), -1.0, 1.0)
+    cos_theta = min(float(max_singular_values(gram)), 1.0)
     return math.degrees(math.acos(cos_theta))
 
 
+def rank_deficient(matrices: np.ndarray, r: np.ndarray) -> np.ndarray:
+    """Flag stacked matrices whose QR factor has a nearly-zero diagonal entry."""
+    eps = np.finfo(matrices.dtype).eps
+    tol = max(matrices.shape[1:]) * eps * np.abs(r).max(axis=(1, 2))
+    diag = np.abs(np.diagonal(r, axis1=1, axis2=2))
+    return np.any(diag <= tol[:, None], axis=1)
+
+
+def orthonormalize_batch(spans: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Batched reduced QR of stacked spans, returning (Q, R)."""
+    if spans.shape[2] == 1:
+        # A single column only needs normalizing; R is its norm.
+        norms = np.linalg.norm(spans, axis=1, keepdims=True)
+        basis = np.divide(spans, norms, out=np.zeros_like(spans), where=norms > 0)
+        return basis, norms
+    return np.linalg.qr(spans)
+
+
+def nested_to_array(
+    nested: List[Any], depth: int, dtype: Any = float
+) -> np.ndarray:
+    # np.array walks every nested list object; flattening with chain and a sized
+    # fromiter converts the floats in one pass.
+    shape: List[int] = []
+    probe: Any = nested
+    for _ in range(depth):
+        shape.append(len(probe))
+        probe = probe[0] if len(probe) else []
+    flat: Any = nested
+    for _ in range(depth - 1):
+        flat = chain.from_iterable(flat)
+    return np.fromiter(flat, dtype=dtype, count=math.prod(shape)).reshape(shape)
+
+
+def qr_angles(cu_spans: np.ndarray, ss_spans: np.ndarray) -> np.ndarray:
+    """Principal angles (degrees) via batched QR of the stacked spans."""
+    cu_basis, cu_r = orthonormalize_batch(cu_spans)
+    ss_basis, ss_r = orthonormalize_batch(ss_spans)
+    gram = np.einsum("kij,kil->kjl", cu_basis, ss_basis)
+    cos_theta = np.minimum(max_singular_values(gram), 1.0)
+    angles = np.degrees(np.arccos(cos_theta))
+
+    # Rank-deficient checkpoints need the column pruning in orthonormal_basis.
+    degenerate = rank_deficient(cu_spans, cu_r) | rank_deficient(ss_spans, ss_r)
+    for idx in np.flatnonzero(degenerate):
+        angles[idx] = principal_angle_degrees(cu_spans[idx], ss_spans[idx])
+    return angles
+
+
+def angle_chunk(vectors: np.ndarray, e_cu_dim: int) -> np.ndarray:
+    """Smallest E^cu/E^ss principal angle (degrees) for a block of checkpoints."""
+    # vectors[k] is shape (dim_vectors, dim_components) = (dim, dim)
+    # Rows correspond to individual CLVs; transpose to put vectors in columns.
+    clv_matrices = vectors.transpose(0, 2, 1)
+    cu_spans = clv_matrices[:, :, :e_cu_dim]
+    ss_spans = clv_matrices[:, :, e_cu_dim:]
+    return qr_angles(cu_spans, ss_spans)
+
+
 def compute_angles(cov_data: Dict[str, Any], e_cu_dim: int) -> np.ndarray:
-    vectors = np.array(cov_data["vectors"], dtype=float)  # (checkpoints, dim, dim)
+    # Double precision is required: near-tangencies (angles well below 0.1 degree)
+    # are what this plot is for, and float32 cosines round them to zero.
+    # shape: (checkpoints, dim, dim)
+    vectors = nested_to_array(cov_data["vectors"], 3)
     times = np.array(cov_data["times"], dtype=float)
     dim = cov_data["dim"]
 
     if e_cu_dim <= 0 or e_cu_dim >= dim:
         raise ValueError("E^cu dimension must be between 1 and dim-1.")
 
-    angles: List[float] = []
-    for idx in range(vectors.shape[0]):
-        # vectors[idx] is shape (dim_vectors, dim_components) = (dim, dim)
-        # Rows correspond to individual CLVs; transpose to put vectors in columns.
-        clv_matrix = vectors[idx].T  # shape (dim, dim)
-        cu_span = clv_matrix[:, :e_cu_dim]
-        ss_span = clv_matrix[:, e_cu_dim:]
-        if ss_span.shape[1] == 0:
-            raise ValueError("Stable subspace has zero dimension; adjust E^cu.")
-        angle = principal_angle_degrees(cu_span, ss_span)
-        angles.append(angle)
-    return times[: len(angles)], np.array(angles, dtype=float)
+    count = vectors.shape[0]
+    workers = os.cpu_count() or 1
+    if count <= PARALLEL_MIN_CHECKPOINTS or workers == 1:
+        angles = angle_chunk(vectors, e_cu_dim)
+    else:
+        # Checkpoints are independent and NumPy's LAPACK calls release the GIL,
+        # so threads over contiguous blocks scale with cores.
+        n_blocks = min(workers, count // PARALLEL_MIN_CHECKPOINTS)
+        blocks = np.array_split(vectors, n_blocks)
+        with ThreadPoolExecutor(max_workers=len(blocks)) as pool:
+            angles = np.concatenate(
+                list(pool.map(lambda block: angle_chunk(block, e_cu_dim), blocks))
+            )
+    return times[: len(angles)], angles
+
+
+def load_or_compute_angles(
+    obj_file: Path, e_cu_dim: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (times, angles), reusing a sibling .angles<E^cu dim>.v<version>.npy when fresh.
+
+    The cache is ignored (and rewritten) whenever the orbit file is newer; caches
+    written by an older ANGLE_CACHE_VERSION are never read.
+    """
+    cache = obj_file.with_suffix(f".angles{e_cu_dim}.v{ANGLE_CACHE_VERSION}.npy")
+    try:
+        if cache.stat().st_mtime_ns > obj_file.stat().st_mtime_ns:
+            cached = np.load(cache)
+            return cached[:, 0], cached[:, 1]
+    except FileNotFoundError:
+        pass
+
+    cov = read_json(obj_file)["covariantVectors"]
+    times, angles = compute_angles(cov, e_cu_dim)
+
+    tmp = cache.with_name(cache.name + ".tmp")
+    try:
+        with tmp.open("wb") as fh:
+            np.save(fh, np.column_stack([times, angles]))
+        tmp.replace(cache)
+    except OSError as exc:
+        print(f"Warning: could not write cache {cache}: {exc}")
+    return times, angles
 
 
 def main() -> None:
@@ -162,9 +311,7 @@ def main() -> None:
         return
 
     rec = prompt_choice(records)
-    obj_data = json.loads(rec["path"].read_text())
-    cov = obj_data["covariantVectors"]
-    dim = cov["dim"]
+    dim = rec["cov_dim"]
 
     e_cu_dim = ask_int(
         "Dimension of E^cu (number of leading CLVs)",
@@ -173,7 +320,7 @@ def main() -> None:
         max_value=dim - 1,
     )
 
-    times, angles = compute_angles(cov, e_cu_dim)
+    times, angles = load_or_compute_angles(rec["path"], e_cu_dim)
 
     fig, ax = plt.subplots(figsize=(10, 6))
     ax.plot(times, angles, color="tab:blue")
@@ -8,27 +8,247 @@ simultaneously, color-coded by their position along the branch.
 Usage:
     python plot_lc_branch.py            # assumes repo layout: data/systems/...
     python plot_lc_branch.py --root /path/to/data/systems
+    python plot_lc_branch.py --save cycles.png   # render to a file, no window
 """
 
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
 import json
+from operator import itemgetter
+import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import matplotlib.pyplot as plt
 from matplotlib.collections import LineCollection
 from mpl_toolkits.mplot3d.art3d import Line3DCollection
 import numpy as np
 
+try:  # imported as part of the scripts package (python -m scripts.<name>)
+    from .json_scan import JSON_DECODER, scan_object, skip_value, skip_ws
+except ImportError:  # run directly, with scripts/ as the first sys.path entry
+    from json_scan import JSON_DECODER, scan_object, skip_value, skip_ws
+
+try:  # optional: orjson parses large float arrays several times faster
+    import orjson
+except ImportError:
+    orjson = None
+
+DISCOVERY_CACHE_NAME = ".lc_branch_cache.json"
+PREFERRED_NTST = (20, 40, 10, 80, 30, 60)  # mesh sizes tried when metadata is missing
+HEADER_PROBE_BYTES = 4096
+LC_HEADER_MARKERS = (b'"continuation"', b'"limit_cycle"', b'"LimitCycle"')
+
+
+def read_json(path: Path) -> Any:
+    """Parse a JSON file, preferring orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text())
+
+
+def _scan_points(text: str, pos: int) -> Tuple[int, Optional[Dict[str, Any]], int]:
+    """Decode only the first element of the array at text[pos]; count the rest."""
+    if text[pos] != "[":
+        return 0, None, skip_value(text, pos)
+    pos = skip_ws(text, pos + 1)
+    if text[pos] == "]":
+        return 0, None, pos + 1
+    first, pos = JSON_DECODER.raw_decode(text, pos)
+    count = 1
+    while True:
+        pos = skip_ws(text, pos)
+        if text[pos] == "]":
+            return count, first, pos + 1
+        pos = skip_value(text, skip_ws(text, pos + 1))
+        count += 1
+
+
+def scan_branch_header(text: str) -> Dict[str, Any]:
+    """
+    Pull discovery metadata out of a branch JSON document without decoding every point.
+
+    Returns the top-level type/branchType/parameterName/parentObject fields, plus
+    data.branch_type, the number of points ("point_count") and the first point
+    ("first_point"), for whichever of those are present.
+    """
+    header: Dict[str, Any] = {}
+
+    def visit_data(key: str, pos: int) -> Optional[int]:
+        if key == "points":
+            header["point_count"], header["first_point"], end = _scan_points(text, pos)
+            return end
+        if key == "branch_type":
+            header["branch_type"], end = JSON_DECODER.raw_decode(text, pos)
+            return end
+        return None
+
+    def visit_top(key: str, pos: int) -> Optional[int]:
+        if key == "data" and text[pos] == "{":
+            return scan_object(text, pos, visit_data)
+        if key in ("type", "branchType", "parameterName", "parentObject"):
+            header[key], end = JSON_DECODER.raw_decode(text, pos)
+            return end
+        return None
+
+    scan_object(text, skip_ws(text, 0), visit_top)
+    return header
+
+
+def _infer_ntst_ncol_dim(state_len: int) -> Tuple[int, int, int]:
+    """Guess (ntst, ncol, dim) for an LC state vector with no mesh metadata."""
+    # Priority order: common dimensions first, then common ncol, then ntst variants
+    for test_dim in [3, 2, 4, 5]:  # Most systems are 2D or 3D
+        for test_ncol in [4, 3, 5]:  # ncol=4 is most common
+            # state = mesh_states + stage_states + period
+            # = ntst*dim + ntst*ncol*dim + 1 = ntst*dim*(ncol+1)+1,
+            # so ntst follows from a single division.
+            block = test_dim * (test_ncol + 1)
+            test_ntst, remainder = divmod(state_len - 1, block)
+            if remainder == 0 and test_ntst in PREFERRED_NTST:
+                return test_ntst, test_ncol, test_dim
+
+    # Fallback: assume common defaults. This is approximate since we can't
+    # invert the layout cleanly.
+    ntst, ncol = 20, 4
+    return ntst, ncol, (state_len - 1) // (ntst * (ncol + 1))
+
+
+def probe_lc_branch(
+    branch_file: Path, sys_name: str, obj_name: str
+) -> Optional[Dict[str, Any]]:
+    """Discovery record for one branch file, or None when it is not an LC branch."""
+    # Only the header fields and first point are decoded here; the full
+    # branch is parsed once the user picks it.
+    with branch_file.open("rb") as fh:
+        head = fh.read(HEADER_PROBE_BYTES)
+        # The CLI writes "type" as the first key, so a continuation branch names
+        # itself within the head; anything else can be rejected unparsed.
+        if not any(marker in head for marker in LC_HEADER_MARKERS):
+            return None
+        raw = head + fh.read()
+    try:
+        data = scan_branch_header(raw.decode("utf-8"))
+    except (ValueError, IndexError):
+        return None
+
+    # Check if this is a continuation type
+    if data.get("type") != "continuation":
+        return None
+
+    point_count = data.get("point_count", 0)
+    first_point = data.get("first_point") or {}
+    
+    if not point_count:
+        return None
+    
+    # Check for top-level branchType field (new format)
+    top_level_type = data.get("branchType")
+    branch_data_type = data.get("branch_type", {})
+    ntst, ncol, dim = 0, 0, 0
+    is_lc = False
+    
+    if top_level_type == "limit_cycle":
+        is_lc = True
+        # Get mesh info from data.branch_type if available
+        # Handle both { LimitCycle: {ntst, ncol} } and { type: 'LimitCycle', ntst, ncol } formats
+        if isinstance(branch_data_type, dict):
+            if "LimitCycle" in branch_data_type:
+                lc_info = branch_data_type["LimitCycle"]
+                ntst = lc_info.get("ntst", 0)
+                ncol = lc_info.get("ncol", 0)
+            elif branch_data_type.get("type") == "LimitCycle":
+                ntst = branch_data_type.get("ntst", 0)
+                ncol = branch_data_type.get("ncol", 0)
+    elif isinstance(branch_data_type, dict):
+        if "LimitCycle" in branch_data_type:
+            lc_info = branch_data_type["LimitCycle"]
+            ntst = lc_info.get("ntst", 0)
+            ncol = lc_info.get("ncol", 0)
+            is_lc = True
+        elif branch_data_type.get("type") == "LimitCycle":
+            ntst = branch_data_type.get("ntst", 0)
+            ncol = branch_data_type.get("ncol", 0)
+            is_lc = True
+    else:
+        # Detect LC by state size - LC states are much larger than equilibrium
+        state_len = len(first_point.get("state", []))
+        
+        # If state length is > 20, it's almost certainly an LC branch
+        if state_len > 20:
+            is_lc = True
+            ntst, ncol, dim = _infer_ntst_ncol_dim(state_len)
+    
+    if not is_lc:
+        return None
+    
+    # Fallback: If is_lc but we don't have ntst/ncol, infer from state size
+    if ntst == 0 or ncol == 0:
+        state_len = len(first_point.get("state", []))
+        if state_len > 20:
+            ntst, ncol, dim = _infer_ntst_ncol_dim(state_len)
+    
+    # Calculate dim if we have branch_type but dim is still 0
+    if dim == 0 and ntst > 0 and ncol > 0:
+        first_state = first_point.get("state", [])
+        total_state_len = len(first_state)
+        # state = ntst*dim*(ncol+1)+1, so dim = (state_len-1)/(ntst*(ncol+1))
+        dim = (total_state_len - 1) // (ntst * (ncol + 1)) if ntst * (ncol + 1) > 0 else 0
+    
+    if dim > 0:
+        return {
+            "system": sys_name,
+            "branch": branch_file.stem,
+            "path": branch_file,
+            "point_count": point_count,
+            "ntst": ntst,
+            "ncol": ncol,
+            "dim": dim,
+            "param_name": data.get("parameterName", "param"),
+            "parent_object": data.get("parentObject", obj_name),
+        }
+    return None
+
+
+def load_discovery_cache(systems_root: Path) -> Dict[str, Any]:
+    """Load the discovery cache, treating a missing or corrupt file as empty."""
+    try:
+        cache = read_json(systems_root / DISCOVERY_CACHE_NAME)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_discovery_cache(systems_root: Path, cache: Dict[str, Any]) -> None:
+    """Atomically replace the discovery cache; failures only cost a re-scan later."""
+    cache_path = systems_root / DISCOVERY_CACHE_NAME
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        tmp_path.write_text(json.dumps(cache))
+        tmp_path.replace(cache_path)
+    except OSError:
+        pass
+
 
 def discover_lc_branches(systems_root: Path) -> List[Dict[str, Any]]:
-    """Discover all limit cycle continuation branches in the data directory."""
+    """
+    Discover all limit cycle continuation branches in the data directory.
+
+    Results are memoized in systems_root/.lc_branch_cache.json, keyed by each branch
+    file's path, mtime and size, so unchanged files are not re-read on later runs.
+    """
     records: List[Dict[str, Any]] = []
     if not systems_root.exists():
         return records
 
+    cache = load_discovery_cache(systems_root)
+    seen: Dict[str, Any] = {}
+    stale: List[Tuple[str, Path, str, str, List[int]]] = []
+
     for system_dir in systems_root.iterdir():
         if not system_dir.is_dir():
             continue
@@ -47,134 +267,32 @@ def discover_lc_branches(systems_root: Path) -> List[Dict[str, Any]]:
                 continue
 
             for branch_file in branches_dir.glob("*.json"):
-                try:
-                    data = json.loads(branch_file.read_text())
-                except json.JSONDecodeError:
-                    continue
-
-                # Check if this is a continuation type
-                if data.get("type") != "continuation":
-                    continue
-
-                branch_data = data.get("data", {})
-                points = branch_data.get("points", [])
-                
-                if not points:
-                    continue
-                
-                # Check for top-level branchType field (new format)
-                top_level_type = data.get("branchType")
-                branch_data_type = branch_data.get("branch_type", {})
-                ntst, ncol, dim = 0, 0, 0
-                is_lc = False
-                
-                if top_level_type == "limit_cycle":
-                    is_lc = True
-                    # Get mesh info from data.branch_type if available
-                    # Handle both { LimitCycle: {ntst, ncol} } and { type: 'LimitCycle', ntst, ncol } formats
-                    if isinstance(branch_data_type, dict):
-                        if "LimitCycle" in branch_data_type:
-                            lc_info = branch_data_type["LimitCycle"]
-                            ntst = lc_info.get("ntst", 0)
-                            ncol = lc_info.get("ncol", 0)
-                        elif branch_data_type.get("type") == "LimitCycle":
-                            ntst = branch_data_type.get("ntst", 0)
-                            ncol = branch_data_type.get("ncol", 0)
-                elif isinstance(branch_data_type, dict):
-                    if "LimitCycle" in branch_data_type:
-                        lc_info = branch_data_type["LimitCycle"]
-                        ntst = lc_info.get("ntst", 0)
-                        ncol = lc_info.get("ncol", 0)
-                        is_lc = True
-                    elif branch_data_type.get("type") == "LimitCycle":
-                        ntst = branch_data_type.get("ntst", 0)
-                        ncol = branch_data_type.get("ncol", 0)
-                        is_lc = True
+                key = str(branch_file)
+                stat = branch_file.stat()
+                stamp = [stat.st_mtime_ns, stat.st_size]
+                entry = cache.get(key)
+                if not isinstance(entry, dict) or entry.get("stamp") != stamp:
+                    stale.append((key, branch_file, sys_name, obj_dir.name, stamp))
                 else:
-                    # Detect LC by state size - LC states are much larger than equilibrium
-                    first_state = points[0].get("state", [])
-                    state_len = len(first_state)
-                    
-                    # If state length is > 20, it's almost certainly an LC branch
-                    if state_len > 20:
-                        is_lc = True
-                        # Try to infer mesh parameters
-                        # Priority order: common dimensions first, then common ncol, then ntst variants
-                        for test_dim in [3, 2, 4, 5]:  # Most systems are 2D or 3D
-                            for test_ncol in [4, 3, 5]:  # ncol=4 is most common
-                                for test_ntst in [20, 40, 10, 80, 30, 60]:  # Include doubled values
-                                    # state = mesh_states + stage_states + period
-                                    # = ntst*dim + ntst*ncol*dim + 1 = ntst*dim*(ncol+1)+1
-                                    expected_len = test_ntst * test_dim * (test_ncol + 1) + 1
-                                    if state_len == expected_len:
-                                        ntst, ncol, dim = test_ntst, test_ncol, test_dim
-                                        break
-                                if ntst > 0:
-                                    break
-                            if ntst > 0:
-                                break
-                        
-                        # Fallback: assume common defaults
-                        if ntst == 0:
-                            ntst, ncol = 20, 4
-                            dim = (state_len - 1) // (ntst * (ncol + 1))
-                
-                if not is_lc:
-                    continue
-                
-                # Fallback: If is_lc but we don't have ntst/ncol, infer from state size
-                if ntst == 0 or ncol == 0:
-                    first_state = points[0].get("state", [])
-                    state_len = len(first_state)
-                    
-                    # Try to infer mesh parameters from state length
-                    # Restructure to prioritize: common dims (2,3) with common ncol (4) first
-                    # Then try doubled ntst values, then unusual ncol
-                    if state_len > 20:
-                        # Priority order: common dimensions first, then common ncol, then ntst variants
-                        for test_dim in [3, 2, 4, 5]:  # Most systems are 2D or 3D
-                            for test_ncol in [4, 3, 5]:  # ncol=4 is most common
-                                for test_ntst in [20, 40, 10, 80, 30, 60]:  # Include doubled values
-                                    # state = mesh_states + stage_states + period
-                                    # = ntst*dim + ntst*ncol*dim + 1 = ntst*dim*(ncol+1)+1
-                                    expected_len = test_ntst * test_dim * (test_ncol + 1) + 1
-                                    if state_len == expected_len:
-                                        ntst, ncol, dim = test_ntst, test_ncol, test_dim
-                                        break
-                                if ntst > 0:
-                                    break
-                            if ntst > 0:
-                                break
-                        
-                        # Fallback: assume common defaults
-                        if ntst == 0:
-                            ntst, ncol = 20, 4
-                            # dim = (state_len - 1) // (ntst * (ncol + 1))
-                            # This is approximate since we can't invert cleanly
-                            total_mesh_stage = (state_len - 1)
-                            dim = total_mesh_stage // (ntst * (ncol + 1)) if ntst * (ncol + 1) > 0 else 0
-                
-                # Calculate dim if we have branch_type but dim is still 0
-                if dim == 0 and ntst > 0 and ncol > 0:
-                    first_state = points[0].get("state", [])
-                    total_state_len = len(first_state)
-                    # state = ntst*dim*(ncol+1)+1, so dim = (state_len-1)/(ntst*(ncol+1))
-                    dim = (total_state_len - 1) // (ntst * (ncol + 1)) if ntst * (ncol + 1) > 0 else 0
-                
-                if dim > 0:
-                    records.append({
-                        "system": sys_name,
-                        "branch": branch_file.stem,
-                        "path": branch_file,
-                        "point_count": len(points),
-                        "ntst": ntst,
-                        "ncol": ncol,
-                        "dim": dim,
-                        "param_name": data.get("parameterName", "param"),
-                        "parent_object": data.get("parentObject", obj_dir.name),
-                    })
-    
-    return sorted(records, key=lambda r: (r["system"], r["branch"]))
+                    seen[key] = entry
+
+    # Probing is dominated by file reads, so overlap them across threads.
+    if stale:
+        workers = min(len(stale), 32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            probed = pool.map(lambda job: probe_lc_branch(job[1], job[2], job[3]), stale)
+            for (key, _, _, _, stamp), record in zip(stale, probed):
+                if record is not None:
+                    record = {**record, "path": key}
+                seen[key] = {"stamp": stamp, "record": record}
+
+    for key, entry in seen.items():
+        if entry.get("record") is not None:
+            records.append({**entry["record"], "path": Path(key)})
+
+    if stale or len(seen) != len(cache):
+        save_discovery_cache(systems_root, seen)
+    return sorted(records, key=itemgetter("system", "branch"))
 
 
 def prompt_choice(records: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -189,10 +307,12 @@ def prompt_choice(records: List[Dict[str, Any]]) -> Dict[str, Any]:
         print(info)
     while True:
         raw = input("\nSelect branch index: ").strip()
-        if raw.isdigit():
+        try:
             idx = int(raw)
             if 0 <= idx < len(records):
                 return records[idx]
+        except ValueError:
+            pass
         print("Invalid selection, try again.")
 
 
@@ -225,68 +345,172 @@ def ask_yes_no(prompt: str, default: bool = True) -> bool:
         print("Please enter y or n.")
 
 
-def load_system_varnames(system_dir: Path) -> List[str]:
-    """Load variable names from system.json if available."""
-    sys_json = system_dir / "system.json"
+@lru_cache(maxsize=None)
+def _load_system_varnames(system_dir: str) -> Tuple[str, ...]:
+    sys_json = Path(system_dir) / "system.json"
     if not sys_json.exists():
-        return []
-    data = json.loads(sys_json.read_text())
-    return data.get("varNames", [])
+        return ()
+    data = read_json(sys_json)
+    return tuple(data.get("varNames", []))
+
+
+def load_system_varnames(system_dir: Path) -> List[str]:
+    """Load variable names from system.json if available (memoized per system)."""
+    return list(_load_system_varnames(str(system_dir)))
 
 
-def extract_limit_cycle(state: List[float], ntst: int, ncol: int, dim: int) -> np.ndarray:
+def limit_cycle_layout(
+    state_len: int, ntst: int, ncol: int, dim: int
+) -> Optional[Tuple[int, bool]]:
     """
-    Extract limit cycle profile from state vector.
-    
-    Rust stores collocation state as:
-      [mesh_states (ntst points), stage_states (ntst*ncol points), period]
-    
-    We extract BOTH mesh and stage states for higher resolution plotting.
-    The states are interleaved to show the full collocation profile.
+    Work out how a collocation state vector of the given length is laid out.
+
+    Returns (mesh_points, has_stages), or None if the state is too short to
+    hold even the mesh.
     """
     mesh_points = ntst  # Number of mesh intervals (NOT ntst+1, due to periodicity)
-    num_stages = ntst * ncol
-    mesh_data_len = mesh_points * dim
-    stage_data_len = num_stages * dim
-    full_state_len = (mesh_points + num_stages) * dim + 1
-    
-    if len(state) < full_state_len:
+    stage_data_len = ntst * ncol * dim
+    if state_len < (mesh_points * dim + stage_data_len) + 1:
         # Fallback: try with ntst+1 mesh points (some formats)
         mesh_points = ntst + 1
-        mesh_data_len = mesh_points * dim
-        full_state_len = (mesh_points + num_stages) * dim + 1
-    
-    if len(state) < mesh_data_len + 1:
-        return np.array([])
-    
-    # Extract mesh states
-    mesh_data = np.array(state[:mesh_data_len]).reshape(mesh_points, dim)
-    
-    # Try to extract stage states too for higher resolution
-    if len(state) >= mesh_data_len + stage_data_len + 1:
-        stage_data = np.array(state[mesh_data_len:mesh_data_len + stage_data_len]).reshape(num_stages, dim)
-        
-        # Interleave mesh and stage points for correct ordering
-        # Each interval has: mesh_point, then ncol stage points
-        full_profile = []
-        for i in range(min(ntst, mesh_points)):
-            full_profile.append(mesh_data[i])
-            for j in range(ncol):
-                stage_idx = i * ncol + j
-                if stage_idx < len(stage_data):
-                    full_profile.append(stage_data[stage_idx])
-        # Add final mesh point if we have ntst+1 mesh points
+    mesh_data_len = mesh_points * dim
+    if state_len < mesh_data_len + 1:
+        return None
+    return mesh_points, state_len >= mesh_data_len + stage_data_len + 1
+
+
+def profile_length(ntst: int, ncol: int, mesh_points: int, has_stages: bool) -> int:
+    """Number of points in an (unclosed) profile for the given layout."""
+    if not has_stages:
+        return mesh_points
+    return ntst * (ncol + 1) + (mesh_points - ntst)
+
+
+def fill_limit_cycle(
+    state: Any,
+    ntst: int,
+    ncol: int,
+    dim: int,
+    mesh_points: int,
+    has_stages: bool,
+    out: np.ndarray,
+) -> None:
+    """
+    Write closed profiles into the preallocated array `out`.
+
+    `state` is one state vector or an (n, state_len) stack of them; `out` has
+    shape (P+1, dim) or (n, P+1, dim) to match.
+    """
+    state = np.asarray(state, dtype=out.dtype)
+    lead = state.shape[:-1]
+    mesh_data_len = mesh_points * dim
+    mesh_data = state[..., :mesh_data_len].reshape(lead + (mesh_points, dim))
+    if has_stages:
+        stage_data = state[..., mesh_data_len:mesh_data_len + ntst * ncol * dim]
+        # Each interval contributes its mesh point followed by its ncol stage points.
+        span = ntst * (ncol + 1)
+        stage_rows = np.arange(span).reshape(ntst, ncol + 1)[:, 1:].ravel()
+        out[..., 0:span:ncol + 1, :] = mesh_data[..., :ntst, :]
+        out[..., stage_rows, :] = stage_data.reshape(lead + (ntst * ncol, dim))
         if mesh_points > ntst:
-            full_profile.append(mesh_data[-1])
-        profile = np.array(full_profile)
+            out[..., -2, :] = mesh_data[..., -1, :]
     else:
-        # Mesh only
-        profile = mesh_data
-    
-    # Close the cycle by appending the first point
-    profile = np.vstack([profile, profile[0:1]])
-    
-    return profile
+        out[..., :-1, :] = mesh_data
+    # Close the cycle by repeating the first point
+    out[..., -1, :] = out[..., 0, :]
+
+
+def extract_limit_cycles(
+    states: np.ndarray, ntst: int, ncol: int, dim: int
+) -> np.ndarray:
+    """
+    Extract limit cycles from equal-length states into one contiguous array.
+
+    Rust stores collocation state as:
+      [mesh_states (ntst points), stage_states (ntst*ncol points), period]
+
+    Mesh and stage states are interleaved to show the full collocation profile.
+    `states` is one (n, state_len) group from group_states; all rows share one
+    collocation layout, so the whole (n, P+1, dim) result is filled with a
+    handful of strided copies.  The cycles only feed matplotlib, which
+    renders in single precision, so they are kept as float32.
+    """
+    layout = limit_cycle_layout(states.shape[1], ntst, ncol, dim)
+    if layout is None or len(states) == 0:
+        return np.empty((0, 0, dim), dtype=np.float32)
+
+    mesh_points, has_stages = layout
+    prof_len = profile_length(ntst, ncol, mesh_points, has_stages)
+    cycles = np.empty((len(states), prof_len + 1, dim), dtype=np.float32)
+    fill_limit_cycle(states, ntst, ncol, dim, mesh_points, has_stages, cycles)
+    return cycles
+
+
+def fresh_states_cache(branch_file: Path) -> Optional[Path]:
+    # Stacked states are cached in a sibling .states.npz so reruns skip parsing
+    # every float; the cache is ignored (and rebuilt) whenever the branch is newer.
+    cache = branch_file.with_suffix(".states.npz")
+    try:
+        if cache.stat().st_mtime_ns > branch_file.stat().st_mtime_ns:
+            return cache
+    except FileNotFoundError:
+        pass
+    return None
+
+
+def load_branch_states(branch_file: Path) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Load the states of all branch points, along with their parameter values.
+
+    Returns (values, offsets, param_values): every state concatenated into one
+    float32 array, with point i occupying values[offsets[i]:offsets[i + 1]].
+    """
+    cache = fresh_states_cache(branch_file)
+    if cache is not None:
+        with np.load(cache) as cached:
+            return cached["values"], cached["offsets"], cached["param_values"]
+
+    points = read_json(branch_file)["data"]["points"]
+    states = [pt.get("state", []) for pt in points]
+    offsets = np.zeros(len(states) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter(map(len, states), dtype=np.int64, count=len(states)), out=offsets[1:])
+    values = np.fromiter(chain.from_iterable(states), dtype=np.float32, count=int(offsets[-1]))
+    param_values = np.array([pt.get("param_value", 0.0) for pt in points], dtype=np.float64)
+
+    cache = branch_file.with_suffix(".states.npz")
+    tmp = cache.with_name(cache.name + ".tmp")
+    try:
+        with tmp.open("wb") as fh:
+            np.savez(fh, values=values, offsets=offsets, param_values=param_values)
+        tmp.replace(cache)
+    except OSError as exc:
+        print(f"Warning: could not write cache {cache}: {exc}")
+    return values, offsets, param_values
+
+
+def group_states(
+    values: np.ndarray, offsets: np.ndarray, selected: np.ndarray
+) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Split the selected points into groups of equal state length.
+
+    Returns one (indices, states) pair per distinct length, where states is the
+    (len(indices), state_len) stack of those points' states.
+    """
+    point_lens = np.diff(offsets)
+    if len(point_lens) and (point_lens == point_lens[0]).all():
+        # Usual case: every point shares one layout, so the states are a plain reshape.
+        return [(selected, values.reshape(len(point_lens), int(point_lens[0]))[selected])]
+
+    lengths = point_lens[selected]
+    groups = []
+    for state_len in np.unique(lengths):
+        indices = selected[lengths == state_len]
+        states = np.empty((len(indices), state_len), dtype=values.dtype)
+        for row, start in zip(states, offsets[indices]):
+            row[:] = values[start:start + state_len]
+        groups.append((indices, states))
+    return groups
 
 
 def main() -> None:
@@ -305,7 +529,16 @@ def main() -> None:
         default=None,
         help="Only plot every N-th limit cycle (prompted if not provided).",
     )
+    parser.add_argument(
+        "--save",
+        type=Path,
+        default=None,
+        help="Write the figure to this image file instead of opening a window.",
+    )
     args = parser.parse_args()
+    if args.save is not None:
+        # No window is needed, so render with the non-interactive Agg backend.
+        plt.switch_backend("Agg")
 
     records = discover_lc_branches(args.root)
     if not records:
@@ -314,15 +547,14 @@ def main() -> None:
 
     rec = prompt_choice(records)
     
-    # Load full branch data
-    branch_data = json.loads(rec["path"].read_text())
-    points = branch_data["data"]["points"]
+    # Load the states of every branch point
+    values, offsets, param_values = load_branch_states(rec["path"])
     ntst = rec["ntst"]
     ncol = rec["ncol"]
     dim = rec["dim"]
     param_name = rec["param_name"]
     
-    print(f"\nLoaded branch with {len(points)} points, dim={dim}")
+    print(f"\nLoaded branch with {len(param_values)} points, dim={dim}")
     
     stride = args.stride if args.stride else ask_int("Plot every N-th cycle (stride)", 1)
     
@@ -347,35 +579,42 @@ def main() -> None:
                 var_names[y_idx] if y_idx < len(var_names) else f"x{y_idx}"
             ]
     
-    # Extract param values and limit cycles
-    param_values = []
-    cycles = []
-    
-    for i, pt in enumerate(points[::stride]):
-        state = pt.get("state", [])
-        param_val = pt.get("param_value", 0.0)
-        
-        cycle = extract_limit_cycle(state, ntst, ncol, dim)
-        if cycle.size > 0:
-            param_values.append(param_val)
-            cycles.append(cycle)
+    # Extract param values and limit cycles, batching points of equal state length
+    cycle_blocks = []
+    param_blocks = []
+    selected = np.arange(0, len(param_values), stride)
+    for indices, states in group_states(values, offsets, selected):
+        cycles = extract_limit_cycles(states, ntst, ncol, dim)
+        if len(cycles) > 0:
+            cycle_blocks.append(cycles)
+            param_blocks.append(param_values[indices])
     
-    if not cycles:
+    if not cycle_blocks:
         print("No valid limit cycles found in branch.")
         return
     
-    print(f"Plotting {len(cycles)} limit cycles...")
+    param_arr = np.concatenate(param_blocks)
+    num_cycles = len(param_arr)
+    if num_cycles < len(selected):
+        print(f"Warning: skipped {len(selected) - num_cycles} points with an unrecognized state layout")
+    print(f"Plotting {num_cycles} limit cycles...")
+    
+    def segments(cols: List[int]) -> Any:
+        # One (n, P+1, k) array when every cycle has the same length, else a ragged list
+        if len(cycle_blocks) == 1:
+            return cycle_blocks[0][:, :, cols]
+        return [cycle[:, cols] for block in cycle_blocks for cycle in block]
     
     # Normalize param values for colormap
-    param_arr = np.array(param_values)
     param_min, param_max = param_arr.min(), param_arr.max()
     if param_max > param_min:
         param_norm = (param_arr - param_min) / (param_max - param_min)
     else:
         param_norm = np.zeros_like(param_arr)
     
-    # Create colormap
+    # Create colormap; one vectorized lookup gives an (n, 4) RGBA row per cycle
     cmap = plt.cm.viridis
+    colors = cmap(param_norm)
     
     # Plot
     if dim == 2 or not plot_3d:
@@ -393,9 +632,10 @@ def main() -> None:
             if not axis_labels[1].startswith('x'):
                 y_idx = var_names.index(axis_labels[1]) if axis_labels[1] in var_names else 1
         
-        for cycle, norm_val in zip(cycles, param_norm):
-            color = cmap(norm_val)
-            ax.plot(cycle[:, x_idx], cycle[:, y_idx], color=color, linewidth=0.8, alpha=0.7)
+        lc = LineCollection(segments([x_idx, y_idx]), colors=colors, linewidths=0.8, alpha=0.7)
+        lc.set_rasterized(True)
+        ax.add_collection(lc)
+        ax.autoscale_view()
         
         ax.set_xlabel(axis_labels[0])
         ax.set_ylabel(axis_labels[1])
@@ -405,9 +645,12 @@ def main() -> None:
         fig = plt.figure(figsize=(12, 9))
         ax = fig.add_subplot(111, projection="3d")
         
-        for cycle, norm_val in zip(cycles, param_norm):
-            color = cmap(norm_val)
-            ax.plot(cycle[:, 0], cycle[:, 1], cycle[:, 2], color=color, linewidth=0.8, alpha=0.7)
+        lc = Line3DCollection(segments([0, 1, 2]), colors=colors, linewidths=0.8, alpha=0.7)
+        lc.set_rasterized(True)
+        ax.add_collection3d(lc)
+        # Collections don't update 3D data limits, so rescale from the cycles
+        xyz = np.concatenate([block[:, :, :3].reshape(-1, 3) for block in cycle_blocks])
+        ax.auto_scale_xyz(xyz[:, 0], xyz[:, 1], xyz[:, 2], had_data=False)
         
         ax.set_xlabel(axis_labels[0])
         ax.set_ylabel(axis_labels[1])
@@ -419,10 +662,14 @@ def main() -> None:
     cbar = plt.colorbar(sm, ax=ax, shrink=0.8, aspect=30)
     cbar.set_label(param_name)
     
-    ax.set_title(f"Limit Cycles: {rec['system']}/{rec['branch']} ({len(cycles)} cycles)")
+    ax.set_title(f"Limit Cycles: {rec['system']}/{rec['branch']} ({num_cycles} cycles)")
     
     plt.tight_layout()
-    plt.show()
+    if args.save is not None:
+        fig.savefig(args.save, dpi=150)
+        print(f"Saved figure to {args.save}")
+    else:
+        plt.show()
 
 
 if __name__ == "__main__":
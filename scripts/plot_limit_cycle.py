@@ -8,60 +8,275 @@ Examples
         --system HopfNF --branch eq_m_LC_11 --repeat 2
 
     python scripts/plot_limit_cycle.py --root /path/to/cli/data/systems
+
+    python scripts/plot_limit_cycle.py --list   # enumerate branches; matplotlib is not imported
 """
 
 from __future__ import annotations
 
 import argparse
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import json
+from operator import attrgetter
+import os
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+import re
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 
-import matplotlib.pyplot as plt
 import numpy as np
 
+if TYPE_CHECKING:  # matplotlib is imported lazily; these names are only annotations
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+    from matplotlib.lines import Line2D
+
+try:  # imported as part of the scripts package (python -m scripts.<name>)
+    from .json_scan import JSON_DECODER, scan_object, skip_value, skip_ws
+except ImportError:  # run directly, with scripts/ as the first sys.path entry
+    from json_scan import JSON_DECODER, scan_object, skip_value, skip_ws
+
+try:  # optional: orjson decodes large float arrays several times faster
+    import orjson
+except ImportError:
+    orjson = None
+
 DEFAULT_ROOT = Path(__file__).resolve().parents[1] / "cli" / "data" / "systems"
+HEADER_PEEK_BYTES = 8192
+BRANCH_INDEX_NAME = ".fork_branch_index.json"
+# CLI naming convention for limit-cycle branches (lc_hopf_*, lc_pd_*, lc_*)
+LC_NAME_PREFIX = "lc_"
+
+BranchRecord = namedtuple("BranchRecord", "system branch path parent_object")
+
+_STATE_ARRAY = re.compile(r'"state"\s*:\s*\[')
+
+
+def _fast_load(path: Path) -> Dict:
+    """Parse a JSON file, preferring orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text())
+
+
+# Parsed documents are memoized per (path, mtime), so repeated loads from the same
+# process (e.g. when imported from a notebook) skip the parse until the file changes.
+@lru_cache(maxsize=32)
+def _read_json_cached(path_str: str, mtime_ns: int) -> Dict:
+    return _fast_load(Path(path_str))
+
+
+def read_json(path: Path) -> Dict:
+    return _read_json_cached(str(path), path.stat().st_mtime_ns)
+
+
+def _peek_branch_header(path: Path) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Return the top-level (type, branchType) of a branch file.
+
+    The CLI writes both keys ahead of the large `data` object, so only the head
+    of the file is normally read; the whole file is parsed only when walking
+    the head's top-level keys cannot settle both values.
+    """
+    with path.open("rb") as fh:
+        head = fh.read(HEADER_PEEK_BYTES)
+    text = head.decode("utf-8", errors="ignore")  # the cut may split a character
+    found: Dict[str, object] = {}
+    try:
+        pos = skip_ws(text, 0)
+        if text[pos] != "{":
+            raise ValueError("branch file is not a JSON object")
+        pos += 1
+        while len(found) < 2:
+            pos = skip_ws(text, pos)
+            if text[pos] == "}":
+                break
+            key, pos = JSON_DECODER.raw_decode(text, pos)
+            pos = skip_ws(text, pos)
+            if text[pos] != ":":
+                raise ValueError("expected ':' after key")
+            pos = skip_ws(text, pos + 1)
+            value, pos = JSON_DECODER.raw_decode(text, pos)
+            if key in ("type", "branchType"):
+                found[key] = value
+            pos = skip_ws(text, pos)
+            if text[pos] == ",":
+                pos += 1
+    except (ValueError, IndexError):
+        data = _fast_load(path)
+        return data.get("type"), data.get("branchType")
+    return found.get("type"), found.get("branchType")
+
+
+def _array_spans(text: str, pos: int) -> Tuple[List[Tuple[int, int]], int]:
+    """Return the (start, end) span of each element of the array at text[pos]."""
+    if text[pos] != "[":
+        raise ValueError("Expected a JSON array.")
+    spans: List[Tuple[int, int]] = []
+    pos = skip_ws(text, pos + 1)
+    if text[pos] == "]":
+        return spans, pos + 1
+    while True:
+        end = skip_value(text, pos)
+        spans.append((pos, end))
+        pos = skip_ws(text, end)
+        if text[pos] == "]":
+            return spans, pos + 1
+        pos = skip_ws(text, pos + 1)  # past ','
+
+
+def _state_length(text: str, start: int, end: int) -> int:
+    """Number of entries in the flat `state` array of the point spanning text[start:end]."""
+    match = _STATE_ARRAY.search(text, start, end)
+    if match is None:
+        return 0
+    close = text.find("]", match.end(), end)
+    if close < 0 or skip_ws(text, match.end()) == close:
+        return 0
+    return text.count(",", match.end(), close) + 1
+
+
+def _index_branch(text: str) -> Tuple[Dict, List[Tuple[int, int]]]:
+    """
+    Decode the top-level fields of a branch document except `data`, and locate
+    each entry of data.points without decoding it.
+    """
+    meta: Dict = {}
+    spans: List[Tuple[int, int]] = []
+
+    def visit_data(key: str, pos: int) -> Optional[int]:
+        if key != "points":
+            return None
+        found, end = _array_spans(text, pos)
+        spans.extend(found)
+        return end
+
+    def visit_top(key: str, pos: int) -> Optional[int]:
+        if key == "data":
+            return scan_object(text, pos, visit_data)
+        meta[key], end = JSON_DECODER.raw_decode(text, pos)
+        return end
+
+    scan_object(text, skip_ws(text, 0), visit_top)
+    return meta, spans
+
+
+@lru_cache(maxsize=8)
+def _index_branch_file(
+    path_str: str, mtime_ns: int
+) -> Tuple[str, Dict, List[Tuple[int, int]], np.ndarray]:
+    """Read and index a branch file once per (path, mtime); see _index_branch."""
+    text = Path(path_str).read_bytes().decode("utf-8")
+    data, spans = _index_branch(text)
+    state_lens = np.fromiter(
+        (_state_length(text, start, end) for start, end in spans), dtype=np.int64, count=len(spans)
+    )
+    return text, data, spans, state_lens
+
+
+def _load_index(systems_root: Path) -> Dict[str, Dict]:
+    """Load the discovery index, treating a missing or corrupt file as empty."""
+    try:
+        index = json.loads((systems_root / BRANCH_INDEX_NAME).read_text())
+    except (OSError, ValueError):
+        return {}
+    return index if isinstance(index, dict) else {}
 
 
-def discover_limit_cycle_branches(systems_root: Path) -> List[Dict[str, str]]:
-    records: List[Dict[str, str]] = []
+def _save_index(systems_root: Path, index: Dict[str, Dict]) -> None:
+    """Atomically replace the discovery index; failures only cost a re-scan later."""
+    index_path = systems_root / BRANCH_INDEX_NAME
+    tmp_path = index_path.with_name(index_path.name + ".tmp")
+    try:
+        tmp_path.write_text(json.dumps(index))
+        tmp_path.replace(index_path)
+    except OSError:
+        pass
+
+
+def discover_limit_cycle_branches(
+    systems_root: Path, trust_filenames: bool = False
+) -> List[BranchRecord]:
+    """
+    Find limit-cycle branches under systems_root.
+
+    Branch headers are memoized in systems_root/.fork_branch_index.json, keyed by
+    each file's path, mtime and size, so unchanged files are not reopened.
+
+    The CLI names limit-cycle branches after their limit-cycle object, so their
+    names start with "lc_" (e.g. lc_hopf_eq_m_mu). With trust_filenames, files
+    following that convention are accepted without being opened unless the index
+    already holds a current entry for them; all other files are checked as usual.
+    """
+    records: List[BranchRecord] = []
     if not systems_root.exists():
         return records
-    for system_dir in systems_root.iterdir():
-        if not system_dir.is_dir():
-            continue
+
+    index = _load_index(systems_root)
+    seen: Dict[str, Dict] = {}
+    candidates: List[BranchRecord] = []
+    stale: List[Tuple[str, List[int]]] = []
+
+    # os.scandir hands back cached file types, avoiding a stat per directory entry.
+    with os.scandir(systems_root) as system_entries:
+        system_dirs = [Path(e.path) for e in system_entries if e.is_dir()]
+    for system_dir in system_dirs:
         objects_dir = system_dir / "objects"
-        if not objects_dir.exists():
+        if not objects_dir.is_dir():
             continue
 
         # Objects-first layout: branches live under objects/<object>/branches/*.json.
-        for obj_dir in objects_dir.iterdir():
-            if not obj_dir.is_dir():
-                continue
+        with os.scandir(objects_dir) as object_entries:
+            obj_dirs = [Path(e.path) for e in object_entries if e.is_dir()]
+        for obj_dir in obj_dirs:
             branches_dir = obj_dir / "branches"
-            if not branches_dir.exists():
+            if not branches_dir.is_dir():
                 continue
-            for branch_path in branches_dir.glob("*.json"):
-                data = json.loads(branch_path.read_text())
-                if data.get("type") != "continuation":
-                    continue
-                if (data.get("branchType") or "equilibrium") != "limit_cycle":
+            with os.scandir(branches_dir) as branch_entries:
+                branch_files = [e for e in branch_entries if e.name.endswith(".json") and e.is_file()]
+            for entry in branch_files:
+                record = BranchRecord(system_dir.name, entry.name[:-5], entry.path, obj_dir.name)
+                stat = entry.stat()
+                stamp = [stat.st_mtime_ns, stat.st_size]
+                cached = index.get(entry.path)
+                fresh = isinstance(cached, dict) and cached.get("stamp") == stamp
+                if trust_filenames and not fresh and record.branch.startswith(LC_NAME_PREFIX):
+                    # Accepted unverified; a later scan without the flag indexes it.
+                    records.append(record)
                     continue
-                records.append(
-                    {
-                        "system": system_dir.name,
-                        "branch": branch_path.stem,
-                        "path": str(branch_path),
-                        "parent_object": obj_dir.name,
-                    }
-                )
-    return sorted(records, key=lambda r: (r["system"], r["branch"]))
-
-
-def prompt_branch(records: List[Dict[str, str]]) -> Dict[str, str]:
+                if fresh:
+                    seen[entry.path] = cached
+                else:
+                    stale.append((entry.path, stamp))
+                candidates.append(record)
+
+    # Header reads of changed files are independent, so overlap them across threads.
+    if stale:
+        workers = min(len(stale), 16, (os.cpu_count() or 1) * 2)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            headers = pool.map(lambda job: _peek_branch_header(Path(job[0])), stale)
+            for (path, stamp), (type_str, branch_type) in zip(stale, headers):
+                seen[path] = {"stamp": stamp, "type": type_str, "branchType": branch_type}
+
+    for record in candidates:
+        cached = seen[record.path]
+        if cached.get("type") != "continuation":
+            continue
+        if (cached.get("branchType") or "equilibrium") != "limit_cycle":
+            continue
+        records.append(record)
+
+    if stale or len(seen) != len(index):
+        _save_index(systems_root, seen)
+    records.sort(key=attrgetter("system", "branch"))
+    return records
+
+
+def prompt_branch(records: List[BranchRecord]) -> BranchRecord:
     print("Limit-cycle continuation branches:\n")
     for idx, rec in enumerate(records):
-        print(f"[{idx}] {rec['system']} / {rec['branch']}")
+        print(f"[{idx}] {rec.system} / {rec.branch}")
     while True:
         raw = input("\nSelect branch index: ").strip()
         if raw.isdigit():
@@ -73,7 +288,15 @@ def prompt_branch(records: List[Dict[str, str]]) -> Dict[str, str]:
 
 def load_branch(
     systems_root: Path, system_name: str, branch_name: str
-) -> Dict:
+) -> Tuple[Dict, Callable[[int], Dict], int, np.ndarray]:
+    """
+    Load a limit-cycle branch lazily.
+
+    Returns (branch_meta, get_point, n_points, state_lens): the top-level fields
+    other than `data`, an accessor that decodes a single point on demand, the
+    number of points, and each point's state length (counted from the raw text,
+    without parsing floats). Only the requested points' floats are ever parsed.
+    """
     # Try to resolve by scanning all objects/*/branches/<branch>.json.
     candidate_paths = list((systems_root / system_name / "objects").glob(f"*/branches/{branch_name}.json"))
     if not candidate_paths:
@@ -82,14 +305,34 @@ def load_branch(
             "Use `objects/<object>/branches/<branch>.json`."
         )
     branch_path = candidate_paths[0]
-    data = json.loads(branch_path.read_text())
+    try:
+        text, data, spans, state_lens = _index_branch_file(
+            str(branch_path), branch_path.stat().st_mtime_ns
+        )
+    except (ValueError, IndexError):
+        # Unexpected structure: fall back to decoding the whole document.
+        data = read_json(branch_path)
+        points = data.get("data", {}).get("points", [])
+        get_point: Callable[[int], Dict] = points.__getitem__
+        n_points = len(points)
+        state_lens = np.fromiter(
+            (len(pt.get("state", [])) for pt in points), dtype=np.int64, count=n_points
+        )
+    else:
+        decode = orjson.loads if orjson is not None else json.loads
+
+        def get_point(i: int) -> Dict:
+            start, end = spans[i]
+            return decode(text[start:end])
+
+        n_points = len(spans)
     if data.get("type") != "continuation":
         raise ValueError(f"{branch_path} is not a continuation branch.")
     if (data.get("branchType") or "equilibrium") != "limit_cycle":
         raise ValueError(
             f'{branch_name} is not a limit-cycle branch (branchType={data.get("branchType")}).'
         )
-    return data
+    return data, get_point, n_points, state_lens
 
 
 def reshape_state_vector(
@@ -129,71 +372,143 @@ def reshape_state_vector(
     return arr, period
 
 
-def plot_limit_cycle(
-    states: np.ndarray,
-    repeat: int,
-    var_names: Optional[List[str]] = None,
-) -> None:
+def _lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
     """
-    Plot the 3D limit-cycle curve by repeating the mesh `repeat` times to visualise continuity.
+    Indices of the points kept by Largest-Triangle-Three-Buckets downsampling.
+
+    The first and last points are always kept. The interior is split into n_out - 2
+    buckets, and from each bucket the point forming the largest triangle with the
+    previously kept point and the mean of the next bucket is chosen.
     """
-    dim = states.shape[1]
+    n = len(x)
+    if n_out < 3 or n_out >= n:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)  # bucket b is [edges[b], edges[b+1])
+    counts = np.diff(edges)
+    mean_x = np.add.reduceat(x[1:-1], edges[:-1] - 1) / counts
+    mean_y = np.add.reduceat(y[1:-1], edges[:-1] - 1) / counts
+    # The "next bucket" of the last interior bucket is the final point itself.
+    next_x = np.append(mean_x[1:], x[-1])
+    next_y = np.append(mean_y[1:], y[-1])
+
+    keep = np.empty(n_out, dtype=int)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for b in range(n_out - 2):
+        lo, hi = edges[b], edges[b + 1]
+        area = np.abs(
+            (x[a] - next_x[b]) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (next_y[b] - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        keep[b + 1] = a
+    return keep
+
+
+def _plot_columns(dim: int) -> List[int]:
     if dim < 2:
         raise ValueError("Need at least 2 variables to plot a limit cycle.")
-    idx_x, idx_y = 0, 1
-    idx_z = 2 if dim >= 3 else None
+    return [0, 1] if dim < 3 else [0, 1, 2]
+
+
+def make_axes(dim: int, var_names: Optional[List[str]] = None) -> Tuple[Figure, Axes, Line2D]:
+    """
+    Create the figure, axes and a single empty line for a limit cycle of dimension `dim`.
 
+    Returns (fig, ax, line), where ax and line are their 3D subclasses when three
+    variables are plotted; feed the line new data with update_limit_cycle so a sweep
+    over points reuses the same artists instead of rebuilding them.
+    """
+    cols = _plot_columns(dim)
     names = var_names or []
-    label_x = names[idx_x] if idx_x < len(names) else f"x{idx_x}"
-    label_y = names[idx_y] if idx_y < len(names) else f"x{idx_y}"
-    label_z = names[idx_z] if idx_z is not None and idx_z < len(names) else (
-        f"x{idx_z}" if idx_z is not None else None
-    )
+    labels = [names[idx] if idx < len(names) else f"x{idx}" for idx in cols]
+
+    import matplotlib.pyplot as plt  # deferred: only needed once something is drawn
 
-    repeated = np.tile(states, (repeat, 1))
     fig = plt.figure(figsize=(8, 6))
-    if idx_z is None:
+    if len(cols) == 2:
         ax = fig.add_subplot(111)
-        ax.plot(repeated[:, idx_x], repeated[:, idx_y], color="tab:blue")
-        ax.set_xlabel(label_x)
-        ax.set_ylabel(label_y)
+        (line,) = ax.plot([], [], color="tab:blue")
     else:
         ax = fig.add_subplot(111, projection="3d")
-        ax.plot3D(
-            repeated[:, idx_x],
-            repeated[:, idx_y],
-            repeated[:, idx_z],
-            color="tab:blue",
-        )
-        ax.set_xlabel(label_x)
-        ax.set_ylabel(label_y)
-        ax.set_zlabel(label_z)
+        (line,) = ax.plot3D([], [], [], color="tab:blue")
+        ax.set_zlabel(labels[2])
+    ax.set_xlabel(labels[0])
+    ax.set_ylabel(labels[1])
+    return fig, ax, line
+
 
+def update_limit_cycle(
+    line: Line2D,
+    ax: Axes,
+    states: np.ndarray,
+    repeat: int,
+    max_points: Optional[int] = None,
+) -> None:
+    """
+    Point an existing line at `states`, repeated `repeat` times, and rescale the axes.
+
+    Curves with more than `max_points` vertices are decimated with LTTB on the
+    first two plotted variables before being handed to matplotlib.
+    """
+    cols = _plot_columns(states.shape[1])
+    # Only the plotted columns are repeated, laid out one row per variable so each
+    # coordinate handed to matplotlib is a contiguous 1-D row: broadcast_to gives a
+    # free (k, repeat, mesh) view and the reshape makes the single copy.
+    plotted = states[:, cols].T
+    mesh = plotted.shape[1]
+    coords = np.broadcast_to(plotted[:, None, :], (len(cols), repeat, mesh)).reshape(len(cols), -1)
+    if max_points is not None and coords.shape[1] > max_points:
+        coords = coords[:, _lttb(coords[0], coords[1], max_points)]
+
+    if len(cols) == 2:
+        line.set_data(coords[0], coords[1])
+        ax.relim()
+        ax.autoscale_view()
+    else:
+        line.set_data_3d(coords[0], coords[1], coords[2])
+        # 3D axes don't track line data limits, so rescale from the curve itself.
+        ax.auto_scale_xyz(coords[0], coords[1], coords[2], had_data=False)
+    ax.figure.canvas.draw_idle()
+
+
+def plot_limit_cycle(
+    states: np.ndarray,
+    repeat: int,
+    var_names: Optional[List[str]] = None,
+    max_points: Optional[int] = None,
+) -> None:
+    """
+    Plot the 3D limit-cycle curve by repeating the mesh `repeat` times to visualise continuity.
+    """
+    import matplotlib.pyplot as plt
+
+    fig, ax, line = make_axes(states.shape[1], var_names)
+    update_limit_cycle(line, ax, states, repeat, max_points)
     ax.set_title(f"Limit cycle (repeat={repeat})")
     plt.tight_layout()
     plt.show()
 
 
 def ask_int(prompt: str, default: int, min_value: int = 0, max_value: Optional[int] = None) -> int:
+    msg = f"{prompt} [{default}]: "
+    upper = f", ≤ {max_value}" if max_value is not None else ""
+    err = f"Enter an integer ≥ {min_value}{upper}."
     while True:
-        raw = input(f"{prompt} [{default}]: ").strip()
+        raw = input(msg).strip()
         if not raw:
             return default
-        try:
+        digits = raw[1:] if raw[:1] in "+-" else raw
+        if digits.isdecimal():
             value = int(raw)
-            if value < min_value:
-                raise ValueError
-            if max_value is not None and value > max_value:
-                raise ValueError
-            return value
-        except ValueError:
-            upper = f", ≤ {max_value}" if max_value is not None else ""
-            print(f"Enter an integer ≥ {min_value}{upper}.")
+            if value >= min_value and (max_value is None or value <= max_value):
+                return value
+        print(err)
 
 
 def ask_float(prompt: str, default: float) -> float:
+    msg = f"{prompt} [{default}]: "
     while True:
-        raw = input(f"{prompt} [{default}]: ").strip()
+        raw = input(msg).strip()
         if not raw:
             return default
         try:
@@ -251,34 +566,55 @@ def main() -> None:
         default=None,
         help="How many periods of the orbit to tile for plotting.",
     )
+    parser.add_argument(
+        "--list",
+        action="store_true",
+        help="Print the discovered limit-cycle branches as JSON and exit (no plotting).",
+    )
+    parser.add_argument(
+        "--trust-filenames",
+        action="store_true",
+        help="Treat branches named lc_* as limit cycles without opening them when they are "
+        "not already indexed; other branches are still checked.",
+    )
+    parser.add_argument(
+        "--max-points",
+        type=int,
+        default=5000,
+        help="Decimate the plotted curve to at most this many vertices (default: 5000).",
+    )
     args = parser.parse_args()
 
     root = args.root
     system = args.system
     branch_name = args.branch
 
+    if args.list:
+        records = discover_limit_cycle_branches(root, trust_filenames=args.trust_filenames)
+        print(json.dumps([rec._asdict() for rec in records], indent=2))
+        return
+
     if not system or not branch_name:
-        records = discover_limit_cycle_branches(root)
+        records = discover_limit_cycle_branches(root, trust_filenames=args.trust_filenames)
         if not records:
             raise RuntimeError(f"No limit-cycle branches found under {root}")
         if not system or not branch_name:
             selected = prompt_branch(records)
-            system = system or selected["system"]
-            branch_name = branch_name or selected["branch"]
+            system = system or selected.system
+            branch_name = branch_name or selected.branch
 
-    branch = load_branch(root, system, branch_name)
-    points: List[Dict] = branch["data"]["points"]
-    if not points:
+    branch, get_point, n_points, state_lens = load_branch(root, system, branch_name)
+    if not n_points:
         raise RuntimeError("Branch has no points.")
-    index = args.index if args.index is not None else len(points) - 1
-    if not (0 <= index < len(points)):
-        raise IndexError(f"Point index {index} out of range [0, {len(points)-1}].")
-    point = points[index]
+    if args.index is None:
+        index = ask_int("Continuation point index", n_points - 1, 0, n_points - 1)
+    else:
+        index = args.index
+        if not (0 <= index < n_points):
+            raise IndexError(f"Point index {index} out of range [0, {n_points-1}].")
+    point = get_point(index)
 
     # figure out mesh and dim
-    if args.index is None:
-        index = ask_int("Continuation point index", len(points) - 1, 0, len(points) - 1)
-    point = points[index]
 
     meta = branch.get("limitCycleMeta") or {}
     mesh_points = args.mesh_points or meta.get("meshPoints")
@@ -296,7 +632,7 @@ def main() -> None:
     system_dir = root / system
     system_json = system_dir / "system.json"
     if system_json.exists():
-        data = json.loads(system_json.read_text())
+        data = read_json(system_json)
         var_names = data.get("varNames")
         dim = data.get("dim") or (len(var_names) if var_names else None)
     else:
@@ -316,28 +652,24 @@ def main() -> None:
     except ValueError as exc:
         print(f"Failed to parse point {index}: {exc}")
         # try to salvage by scanning for a point with the expected length
-        fallback = None
         stage_block = mesh_points * degree * dim
         expected_len = mesh_points * dim + stage_block + 1
-        for idx, candidate in enumerate(points):
-            if len(candidate["state"]) >= expected_len:
-                fallback = (idx, candidate)
-                break
-        if fallback is None:
+        hits = np.nonzero(state_lens >= expected_len)[0]
+        if not hits.size:
             raise ValueError(
                 f"{exc}\nNo points in this branch have length ≥ {expected_len}; "
                 "double-check mesh/dim settings or pass overrides."
             ) from exc
-        print(f"Trying fallback point {fallback[0]} instead.")
-        point = fallback[1]
+        index = int(hits[0])
+        print(f"Trying fallback point {index} instead.")
+        point = get_point(index)
         states, period = reshape_state_vector(point["state"], dim, mesh_points, degree)
-        index = fallback[0]
     print(
         f"Point index {index}: param={point['param_value']:.6f}, "
         f"period={period:.6f}, states shape={states.shape}"
     )
     repeat = args.repeat if args.repeat is not None else ask_int("Repeat periods", 2, 1)
-    plot_limit_cycle(states, repeat, var_names=var_names)
+    plot_limit_cycle(states, repeat, var_names=var_names, max_points=args.max_points)
 
 
 if __name__ == "__main__":